@@ -4,26 +4,72 @@ Smart Facts Dashboard Builder
 Extracts Smart Facts data from the codebase and generates the dashboard HTML
 """
 
+import io
 import os
 import re
+import ast
+import base64
+import csv
+import gzip
 import json
-from datetime import datetime
+import time
+import hashlib
+import functools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 
+# orjson is optional; it encodes and decodes JSON several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Patterns used to parse the Smart Facts source files, compiled once per process
+_STRING_LITERAL = r"""(?P<literal>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')"""
+_DISPLAY_TEMPLATE_RE = re.compile(r"['\"](?P<id>\w+)['\"]\s*:\s*" + _STRING_LITERAL)
+
+# Insights payload fetched by the dashboard page
+INSIGHTS_JSON_FILE = 'insights.json'
+
+# Static CSV export linked from the dashboard's Export button
+CSV_EXPORT_FILE = 'smart_facts_export.csv'
+
+# Pages already written by this process (warm Lambda containers), oldest first, mapped
+# to their gzipped, base64-encoded response body once main() has needed one
+_HTML_CACHE = OrderedDict()
+_HTML_CACHE_SIZE = 4
+
+# Flags for the temp files outputs are written to; O_BINARY only exists (and matters) on Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# Gettext-style wrappers whose single argument is the literal display text
+_TRANSLATION_CALLS = ('_', 'gettext', 'gettext_lazy', 'ugettext', 'ugettext_lazy')
+
+# Parsed insights are cached here between builds, keyed by the source files' paths and stats
+SMART_FACTS_CACHE_FILE = '.smart_facts_cache.json'
+
+# Part of that key too, so editing the parsers in this file invalidates the cache
+_PARSER_DIGEST = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+
 def extract_smart_facts_from_codebase():
     """Extract Smart Facts data from the codebase files"""
     
-    # Try multiple possible paths for the codebase
-    possible_paths = [
-        os.environ.get('CODEBASE_PATH'),
-        '../hometap',  # If dashboard is in subdirectory
-        '../../hometap',  # If dashboard is in subdirectory of subdirectory
-        '/tmp/codebase'  # Fallback
-    ]
+    # An explicit CODEBASE_PATH wins outright; otherwise try the usual locations
+    env_path = os.environ.get('CODEBASE_PATH')
+    if env_path:
+        possible_paths = [env_path]
+    else:
+        possible_paths = [
+            '../hometap',  # If dashboard is in subdirectory
+            '../../hometap',  # If dashboard is in subdirectory of subdirectory
+            '/tmp/codebase'  # Fallback
+        ]
     
     codebase_path = None
     for path in possible_paths:
-        if path and os.path.exists(path):
+        if os.path.isdir(path):
             codebase_path = path
             break
     
@@ -52,26 +98,143 @@ def extract_from_files(codebase_path):
     templates_file = os.path.join(codebase_path, 'eng_portals/portals/portals/apps/smart_facts/display_templates.py')
     
     if os.path.exists(definitions_file) and os.path.exists(templates_file):
-        # Parse the Python files to extract Smart Facts
-        # This is a simplified version - you'd want more robust parsing
-        with open(definitions_file, 'r') as f:
-            definitions_content = f.read()
+        # Only re-parse when a source file or the parsers have changed since the last build
+        definitions_stat = os.stat(definitions_file)
+        templates_stat = os.stat(templates_file)
+        cache_key = (
+            _PARSER_DIGEST,
+            os.path.realpath(definitions_file), definitions_stat.st_mtime_ns, definitions_stat.st_size,
+            os.path.realpath(templates_file), templates_stat.st_mtime_ns, templates_stat.st_size
+        )
+        insights = _parse_files(definitions_file, templates_file, cache_key)
         
-        with open(templates_file, 'r') as f:
-            templates_content = f.read()
+        if not insights:
+            # Nothing recognisable in the definitions file
+            insights = get_hardcoded_insights()
+    
+    return insights
+
+@functools.lru_cache(maxsize=4)
+def _parse_files(definitions_file, templates_file, cache_key):
+    """Parse the Smart Facts source files, reusing the on-disk cache when it matches"""
+    try:
+        cached = _loads(Path(SMART_FACTS_CACHE_FILE).read_bytes())
+        if cached.get('key') == list(cache_key):
+            return cached['insights']
+    except (OSError, ValueError, KeyError):
+        pass
+    
+    # Read and parse the two Python files side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        definitions_future = executor.submit(_read_and_parse, parse_definitions, definitions_file)
+        templates_future = executor.submit(_read_and_parse, parse_display_templates, templates_file)
+        definitions = definitions_future.result()
+        templates = templates_future.result()
+    
+    # Join each definition to its display copy, keeping content right after the ID
+    insights = [
+        {"id": definition["id"], "content": templates.get(definition["id"], ""), **definition}
+        for definition in definitions
+    ]
+    
+    try:
+        _write_atomic(SMART_FACTS_CACHE_FILE, _dumps({'key': cache_key, 'insights': insights}))
+    except OSError as e:
+        print(f"Could not write Smart Facts cache: {e}")
+    
+    return insights
+
+def _read_and_parse(parse, path):
+    """Read one of the Smart Facts source files and run it through its parser"""
+    return parse(Path(path).read_text(encoding='utf-8'))
+
+def parse_display_templates(templates_content):
+    """Map Smart Fact IDs to their display copy"""
+    return {
+        match.group('id'): ast.literal_eval(match.group('literal'))
+        for match in _DISPLAY_TEMPLATE_RE.finditer(templates_content)
+    }
+
+def parse_definitions(definitions_content):
+    """Build insight records from the SmartFactDefinition(...) calls"""
+    insights = []
+    
+    # ast.walk is breadth-first, so sort the calls back into source order
+    calls = sorted(
+        (node for node in ast.walk(ast.parse(definitions_content))
+         if isinstance(node, ast.Call) and _node_name(node.func) == 'SmartFactDefinition'),
+        key=lambda node: (node.lineno, node.col_offset)
+    )
+    
+    for node in calls:
+        fields = {kw.arg: kw.value for kw in node.keywords}
+        if 'id' not in fields:
+            continue
         
-        # Extract Smart Fact definitions
-        # Look for patterns like SmartFactDefinition(...)
-        # This is where you'd implement the actual parsing logic
+        insight_id = _literal(fields['id'], None)
+        if not isinstance(insight_id, str):
+            print(f"Skipping SmartFactDefinition on line {node.lineno}: id is not a string literal")
+            continue
+        keys = _literal(fields.get('template_keys'), [])
         
-        # For now, return hardcoded data
-        insights = get_hardcoded_insights()
+        cta = None
+        if isinstance(fields.get('cta'), ast.Call):
+            cta_fields = {kw.arg: kw.value for kw in fields['cta'].keywords}
+            cta = {
+                "text": _literal(cta_fields.get('text'), ''),
+                "url": _literal(cta_fields.get('url'), '')
+            }
+        
+        required_context = fields.get('required_context')
+        
+        insights.append({
+            "id": insight_id,
+            "status": _node_name(fields['status']).lower() if 'status' in fields else "draft",
+            "priority": _literal(fields.get('priority'), 1),
+            "isDynamic": bool(keys),
+            "hasCta": cta is not None,
+            "cta": cta,
+            "requiredContext": [_node_name(item) for item in getattr(required_context, 'elts', [])],
+            "requiresPrimaryUser": _is_true(fields.get('requires_primary_user')),
+            "requiresProfileComplete": _is_true(fields.get('requires_profile_complete')),
+            "templateKeys": keys
+        })
     
     return insights
 
+def _literal(node, default):
+    """Evaluate a keyword value node, or fall back to default when it isn't a plain literal
+    
+    Translated strings (_("...")) are unwrapped to their text; anything else that
+    literal_eval rejects, like Priority.HIGH, gives the default for that field only.
+    """
+    if node is None:
+        return default
+    if isinstance(node, ast.Call) and _node_name(node.func) in _TRANSLATION_CALLS and len(node.args) == 1:
+        node = node.args[0]
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError):
+        return default
+
+def _node_name(node):
+    """Reduce a name, enum reference (Status.LIVE) or string literal node to its bare name"""
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Constant):
+        return str(node.value)
+    return ''
+
+def _is_true(node):
+    """Whether a keyword value node is the literal True"""
+    return isinstance(node, ast.Constant) and node.value is True
+
+@functools.lru_cache(maxsize=1)
 def get_hardcoded_insights():
-    """Fallback hardcoded insights data"""
-    return [
+    """Fallback hardcoded insights data, built once and shared (treat as read-only)"""
+    return (
         # Static Content Insights
         {
             "id": "SMRT1",
@@ -91,490 +254,233 @@ def get_hardcoded_insights():
         },
         # Add more insights here...
         # This would be populated with all your Smart Facts data
+    )
+
+# Format of the dashboard's "Last updated" stamp, always in UTC
+_NOW_FMT = "%B %d, %Y at %I:%M %p UTC"
+
+# Display order of statuses; the dashboard groups insights in this order
+STATUS_ORDER = ('live', 'review', 'draft', 'retired', 'archived')
+
+# Dashboard page, read once per process; the two __PLACEHOLDER__ markers are filled in at build time
+HTML_TEMPLATE = (Path(__file__).parent / 'dashboard_template.html').read_text(encoding='utf-8')
+
+def _split_template(template, marker):
+    """Split the template around a placeholder that must appear exactly once"""
+    parts = template.split(marker)
+    if len(parts) != 2:
+        raise ValueError(f"dashboard_template.html must contain {marker} exactly once, found {len(parts) - 1}")
+    return parts
+
+# Split and UTF-8 encode once at import, so each build only encodes the two small values
+_prefix, _rest = _split_template(HTML_TEMPLATE, '__LAST_UPDATED__')
+_middle, _suffix = _split_template(_rest, '__INSIGHTS_VERSION__')
+_HTML_PREFIX = _prefix.encode('utf-8')
+_HTML_MIDDLE = _middle.encode('utf-8')
+_HTML_SUFFIX = _suffix.encode('utf-8')
+del _prefix, _rest, _middle, _suffix
+
+def generate_insights_json(insights):
+    """Serialize the insights payload the dashboard fetches, as UTF-8 bytes"""
+    
+    # Lowercase the searchable fields once here instead of on every keystroke
+    searchable = [
+        dict(_compact(insight), _id_lc=insight['id'].lower(), _content_lc=insight['content'].lower())
+        for insight in insights
     ]
+    
+    # Group by status so the page can narrow a status filter to a slice
+    rank = {status: i for i, status in enumerate(STATUS_ORDER)}
+    ordered = sorted(searchable, key=lambda insight: (rank.get(insight['status'], len(rank)), insight['status']))
+    by_status = {}
+    for i, insight in enumerate(ordered):
+        start, _ = by_status.get(insight['status'], (i, i))
+        by_status[insight['status']] = (start, i + 1)
+    
+    # Compact unless DASHBOARD_PRETTY_JSON is set for debugging
+    payload = {'insights': ordered, 'byStatus': by_status}
+    return _dumps(payload, indent=bool(os.environ.get('DASHBOARD_PRETTY_JSON')))
 
-def generate_dashboard_html(insights):
-    """Generate the complete dashboard HTML"""
-    
-    # Read the base HTML template
-    html_template = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Smart Facts Dashboard - Marketing Team</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <script src="https://unpkg.com/alpinejs@3.x.x/dist/cdn.min.js" defer></script>
-    <style>
-        .gradient-bg {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        }
-        .card-hover {
-            transition: all 0.3s ease;
-        }
-        .card-hover:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 10px 25px rgba(0,0,0,0.1);
-        }
-        .status-badge {
-            font-size: 0.75rem;
-            font-weight: 600;
-            padding: 0.25rem 0.75rem;
-            border-radius: 9999px;
-        }
-        .status-live { background-color: #dcfce7; color: #166534; }
-        .status-review { background-color: #fef3c7; color: #92400e; }
-        .status-draft { background-color: #e5e7eb; color: #374151; }
-        .status-retired { background-color: #f3f4f6; color: #6b7280; }
-        .status-archived { background-color: #fee2e2; color: #991b1b; }
-    </style>
-</head>
-<body class="bg-gray-50">
-    <div x-data="smartFactsDashboard()" class="min-h-screen">
-        <!-- Header -->
-        <header class="gradient-bg text-white shadow-lg">
-            <div class="max-w-6xl mx-auto px-6 sm:px-8 lg:px-12 py-6">
-                <div class="flex items-center justify-between">
-                    <div>
-                        <h1 class="text-3xl font-bold">Smart Facts Dashboard</h1>
-                        <p class="text-blue-100 mt-1">Marketing Team - Content Management System</p>
-                        <p class="text-blue-200 text-sm mt-1">Last updated: {last_updated}</p>
-                    </div>
-                    <div class="text-right">
-                        <div class="text-2xl font-bold" x-text="stats.total"></div>
-                        <div class="text-blue-100">Total Insights</div>
-                    </div>
-                </div>
-            </div>
-        </header>
-
-        <!-- Controls -->
-        <div class="max-w-6xl mx-auto px-6 sm:px-8 lg:px-12 py-6">
-            <div class="bg-white rounded-lg shadow-sm p-6 mb-6">
-                <div class="grid grid-cols-1 md:grid-cols-5 gap-4">
-                    <!-- Search -->
-                    <div class="md:col-span-2">
-                        <label class="block text-sm font-medium text-gray-700 mb-2">Search Insights</label>
-                        <input 
-                            type="text" 
-                            x-model="searchQuery"
-                            placeholder="Search by ID, content, or keywords..."
-                            class="w-full px-3 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500"
-                        >
-                    </div>
-                    
-                    <!-- Status Filter -->
-                    <div>
-                        <label class="block text-sm font-medium text-gray-700 mb-2">Status</label>
-                        <select 
-                            x-model="statusFilter"
-                            class="w-full px-3 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500"
-                        >
-                            <option value="">All Statuses</option>
-                            <option value="live">Live</option>
-                            <option value="review">Under Review</option>
-                            <option value="draft">Draft</option>
-                            <option value="retired">Retired</option>
-                            <option value="archived">Archived</option>
-                        </select>
-                    </div>
-                    
-                    <!-- Type Filter -->
-                    <div>
-                        <label class="block text-sm font-medium text-gray-700 mb-2">Type</label>
-                        <select 
-                            x-model="typeFilter"
-                            class="w-full px-3 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500"
-                        >
-                            <option value="">All Types</option>
-                            <option value="static">Static Content</option>
-                            <option value="dynamic">Dynamic Content</option>
-                        </select>
-                    </div>
-                    
-                    <!-- View Toggle -->
-                    <div>
-                        <label class="block text-sm font-medium text-gray-700 mb-2">View</label>
-                        <div class="flex rounded-md shadow-sm">
-                            <button 
-                                @click="viewMode = 'grid'"
-                                :class="viewMode === 'grid' ? 'bg-blue-600 text-white' : 'bg-white text-gray-700 hover:bg-gray-50'"
-                                class="px-3 py-2 text-sm font-medium border border-gray-300 rounded-l-md focus:outline-none focus:ring-2 focus:ring-blue-500"
-                            >
-                                <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M4 6a2 2 0 012-2h2a2 2 0 012 2v2a2 2 0 01-2 2H6a2 2 0 01-2-2V6zM14 6a2 2 0 012-2h2a2 2 0 012 2v2a2 2 0 01-2 2h-2a2 2 0 01-2-2V6zM4 16a2 2 0 012-2h2a2 2 0 012 2v2a2 2 0 01-2 2H6a2 2 0 01-2-2v-2zM14 16a2 2 0 012-2h2a2 2 0 012 2v2a2 2 0 01-2 2h-2a2 2 0 01-2-2v-2z"></path>
-                                </svg>
-                            </button>
-                            <button 
-                                @click="viewMode = 'list'"
-                                :class="viewMode === 'list' ? 'bg-blue-600 text-white' : 'bg-white text-gray-700 hover:bg-gray-50'"
-                                class="px-3 py-2 text-sm font-medium border border-gray-300 rounded-r-md focus:outline-none focus:ring-2 focus:ring-blue-500"
-                            >
-                                <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M4 6h16M4 10h16M4 14h16M4 18h16"></path>
-                                </svg>
-                            </button>
-                        </div>
-                    </div>
-                </div>
-                
-                <!-- Export Button -->
-                <div class="mt-4 flex justify-end">
-                    <button 
-                        @click="exportToCSV()"
-                        class="inline-flex items-center px-4 py-2 border border-transparent text-sm font-medium rounded-md shadow-sm text-white bg-green-600 hover:bg-green-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-green-500"
-                    >
-                        <svg class="w-4 h-4 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 10v6m0 0l-3-3m3 3l3-3m2 8H7a2 2 0 01-2-2V5a2 2 0 012-2h5.586a1 1 0 01.707.293l5.414 5.414a1 1 0 01.293.707V19a2 2 0 01-2 2z"></path>
-                        </svg>
-                        Export CSV
-                    </button>
-                </div>
-            </div>
-
-            <!-- Stats Cards -->
-            <div class="max-w-6xl mx-auto px-6 sm:px-8 lg:px-12">
-                <div class="grid grid-cols-1 md:grid-cols-5 gap-6 mb-6">
-                    <div class="bg-white rounded-lg shadow-sm p-6">
-                        <div class="flex items-center">
-                            <div class="p-2 bg-green-100 rounded-lg">
-                                <svg class="w-6 h-6 text-green-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M9 12l2 2 4-4m6 2a9 9 0 11-18 0 9 9 0 0118 0z"></path>
-                                </svg>
-                            </div>
-                            <div class="ml-4">
-                                <p class="text-sm font-medium text-gray-600">Live</p>
-                                <p class="text-2xl font-semibold text-gray-900" x-text="stats.live"></p>
-                            </div>
-                        </div>
-                    </div>
-                    
-                    <div class="bg-white rounded-lg shadow-sm p-6">
-                        <div class="flex items-center">
-                            <div class="p-2 bg-yellow-100 rounded-lg">
-                                <svg class="w-6 h-6 text-yellow-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 8v4l3 3m6-3a9 9 0 11-18 0 9 9 0 0118 0z"></path>
-                                </svg>
-                            </div>
-                            <div class="ml-4">
-                                <p class="text-sm font-medium text-gray-600">Under Review</p>
-                                <p class="text-2xl font-semibold text-gray-900" x-text="stats.review"></p>
-                            </div>
-                        </div>
-                    </div>
-                    
-                    <div class="bg-white rounded-lg shadow-sm p-6">
-                        <div class="flex items-center">
-                            <div class="p-2 bg-blue-100 rounded-lg">
-                                <svg class="w-6 h-6 text-blue-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M13 10V3L4 14h7v7l9-11h-7z"></path>
-                                </svg>
-                            </div>
-                            <div class="ml-4">
-                                <p class="text-sm font-medium text-gray-600">Dynamic</p>
-                                <p class="text-2xl font-semibold text-gray-900" x-text="stats.dynamic"></p>
-                            </div>
-                        </div>
-                    </div>
-                    
-                    <div class="bg-white rounded-lg shadow-sm p-6">
-                        <div class="flex items-center">
-                            <div class="p-2 bg-purple-100 rounded-lg">
-                                <svg class="w-6 h-6 text-purple-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M7 4V2a1 1 0 011-1h8a1 1 0 011 1v2m-9 0h10m-10 0a2 2 0 00-2 2v12a2 2 0 002 2h10a2 2 0 002-2V6a2 2 0 00-2-2M9 10h6M9 14h6"></path>
-                                </svg>
-                            </div>
-                            <div class="ml-4">
-                                <p class="text-sm font-medium text-gray-600">With CTA</p>
-                                <p class="text-2xl font-semibold text-gray-900" x-text="stats.withCta"></p>
-                            </div>
-                        </div>
-                    </div>
-                    
-                    <div class="bg-white rounded-lg shadow-sm p-6">
-                        <div class="flex items-center">
-                            <div class="p-2 bg-gray-100 rounded-lg">
-                                <svg class="w-6 h-6 text-gray-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M9 12h6m-6 4h6m2 5H7a2 2 0 01-2-2V5a2 2 0 012-2h5.586a1 1 0 01.707.293l5.414 5.414a1 1 0 01.293.707V19a2 2 0 01-2 2z"></path>
-                                </svg>
-                            </div>
-                            <div class="ml-4">
-                                <p class="text-sm font-medium text-gray-600">Retired</p>
-                                <p class="text-2xl font-semibold text-gray-900" x-text="stats.retired"></p>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-
-            <!-- Insights Display -->
-            <div class="max-w-6xl mx-auto px-6 sm:px-8 lg:px-12">
-            <!-- Grid View -->
-            <div x-show="viewMode === 'grid'" class="grid grid-cols-1 lg:grid-cols-2 xl:grid-cols-3 gap-6">
-                <template x-for="insight in filteredInsights" :key="insight.id">
-                    <div class="bg-white rounded-lg shadow-sm p-6 card-hover">
-                        <!-- Header -->
-                        <div class="flex items-start justify-between mb-4">
-                            <div>
-                                <h3 class="text-lg font-semibold text-gray-900" x-text="insight.id"></h3>
-                                <div class="flex items-center space-x-2 mt-1">
-                                    <span class="status-badge" :class="'status-' + insight.status" x-text="insight.status"></span>
-                                    <span x-show="insight.isDynamic" class="px-2 py-1 bg-blue-100 text-blue-800 text-xs rounded-full">Dynamic</span>
-                                    <span x-show="insight.hasCta" class="px-2 py-1 bg-purple-100 text-purple-800 text-xs rounded-full">CTA</span>
-                                </div>
-                            </div>
-                            <div class="text-right">
-                                <div class="text-sm text-gray-500">Priority</div>
-                                <div class="text-lg font-semibold" x-text="insight.priority"></div>
-                            </div>
-                        </div>
-
-                        <!-- Content -->
-                        <div class="mb-4">
-                            <h4 class="text-sm font-medium text-gray-700 mb-2">Content:</h4>
-                            <p class="text-gray-600 text-sm leading-relaxed" x-text="insight.content"></p>
-                        </div>
-
-                        <!-- Dynamic Variables -->
-                        <div x-show="insight.templateKeys && insight.templateKeys.length > 0" class="mb-4">
-                            <h4 class="text-sm font-medium text-gray-700 mb-2">Dynamic Variables:</h4>
-                            <div class="flex flex-wrap gap-1">
-                                <template x-for="key in insight.templateKeys" :key="key">
-                                    <span class="px-2 py-1 bg-gray-100 text-gray-700 text-xs rounded" x-text="key"></span>
-                                </template>
-                            </div>
-                        </div>
-
-                        <!-- CTA -->
-                        <div x-show="insight.cta" class="mb-4">
-                            <h4 class="text-sm font-medium text-gray-700 mb-2">Call to Action:</h4>
-                            <div class="bg-gray-50 p-3 rounded">
-                                <div class="text-sm font-medium text-gray-900" x-text="insight.cta.text"></div>
-                                <div class="text-xs text-blue-600 mt-1 break-all" x-text="insight.cta.url"></div>
-                            </div>
-                        </div>
-
-                        <!-- Requirements -->
-                        <div class="text-xs text-gray-500 space-y-1">
-                            <div x-show="insight.requiresPrimaryUser">✓ Requires Primary User</div>
-                            <div x-show="insight.requiresProfileComplete">✓ Requires Profile Complete</div>
-                            <div x-show="insight.requiredContext && insight.requiredContext.length > 0">
-                                Context: <span x-text="insight.requiredContext.join(', ')"></span>
-                            </div>
-                        </div>
-                    </div>
-                </template>
-            </div>
-
-            <!-- List View -->
-            <div x-show="viewMode === 'list'" class="space-y-4">
-                <template x-for="insight in filteredInsights" :key="insight.id">
-                    <div class="bg-white rounded-lg shadow-sm p-6 card-hover">
-                        <div class="flex items-start space-x-4">
-                            <!-- Left Column: ID and Status -->
-                            <div class="flex-shrink-0 w-32">
-                                <h3 class="text-lg font-semibold text-gray-900" x-text="insight.id"></h3>
-                                <div class="flex flex-col space-y-2 mt-2">
-                                    <span class="status-badge" :class="'status-' + insight.status" x-text="insight.status"></span>
-                                    <div class="flex space-x-1">
-                                        <span x-show="insight.isDynamic" class="px-2 py-1 bg-blue-100 text-blue-800 text-xs rounded-full">Dynamic</span>
-                                        <span x-show="insight.hasCta" class="px-2 py-1 bg-purple-100 text-purple-800 text-xs rounded-full">CTA</span>
-                                    </div>
-                                    <div class="text-xs text-gray-500">
-                                        Priority: <span class="font-semibold" x-text="insight.priority"></span>
-                                    </div>
-                                </div>
-                            </div>
-                            
-                            <!-- Middle Column: Content -->
-                            <div class="flex-1 min-w-0">
-                                <h4 class="text-sm font-medium text-gray-700 mb-2">Content:</h4>
-                                <p class="text-gray-600 text-sm leading-relaxed" x-text="insight.content"></p>
-                                
-                                <!-- Dynamic Variables -->
-                                <div x-show="insight.templateKeys && insight.templateKeys.length > 0" class="mt-3">
-                                    <h4 class="text-sm font-medium text-gray-700 mb-2">Dynamic Variables:</h4>
-                                    <div class="flex flex-wrap gap-1">
-                                        <template x-for="key in insight.templateKeys" :key="key">
-                                            <span class="px-2 py-1 bg-gray-100 text-gray-700 text-xs rounded" x-text="key"></span>
-                                        </template>
-                                    </div>
-                                </div>
-                                
-                                <!-- CTA -->
-                                <div x-show="insight.cta" class="mt-3">
-                                    <h4 class="text-sm font-medium text-gray-700 mb-2">Call to Action:</h4>
-                                    <div class="bg-gray-50 p-3 rounded">
-                                        <div class="text-sm font-medium text-gray-900" x-text="insight.cta.text"></div>
-                                        <div class="text-xs text-blue-600 mt-1 break-all" x-text="insight.cta.url"></div>
-                                    </div>
-                                </div>
-                            </div>
-                            
-                            <!-- Right Column: Requirements -->
-                            <div class="flex-shrink-0 w-48">
-                                <h4 class="text-sm font-medium text-gray-700 mb-2">Requirements:</h4>
-                                <div class="text-xs text-gray-500 space-y-1">
-                                    <div x-show="insight.requiresPrimaryUser" class="flex items-center">
-                                        <svg class="w-3 h-3 text-green-500 mr-1" fill="currentColor" viewBox="0 0 20 20">
-                                            <path fill-rule="evenodd" d="M16.707 5.293a1 1 0 010 1.414l-8 8a1 1 0 01-1.414 0l-4-4a1 1 0 011.414-1.414L8 12.586l7.293-7.293a1 1 0 011.414 0z" clip-rule="evenodd"></path>
-                                        </svg>
-                                        Primary User
-                                    </div>
-                                    <div x-show="insight.requiresProfileComplete" class="flex items-center">
-                                        <svg class="w-3 h-3 text-green-500 mr-1" fill="currentColor" viewBox="0 0 20 20">
-                                            <path fill-rule="evenodd" d="M16.707 5.293a1 1 0 010 1.414l-8 8a1 1 0 01-1.414 0l-4-4a1 1 0 011.414-1.414L8 12.586l7.293-7.293a1 1 0 011.414 0z" clip-rule="evenodd"></path>
-                                        </svg>
-                                        Profile Complete
-                                    </div>
-                                    <div x-show="insight.requiredContext && insight.requiredContext.length > 0" class="mt-2">
-                                        <div class="text-xs font-medium text-gray-700">Context:</div>
-                                        <div class="text-xs text-gray-600" x-text="insight.requiredContext.join(', ')"></div>
-                                    </div>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                </template>
-            </div>
-
-            <!-- Empty State -->
-            <div x-show="filteredInsights.length === 0" class="text-center py-12">
-                <svg class="mx-auto h-12 w-12 text-gray-400" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M9.172 16.172a4 4 0 015.656 0M9 12h6m-6-4h6m2 5.291A7.962 7.962 0 0112 15c-2.34 0-4.29-1.009-5.824-2.709M15 6.291A7.962 7.962 0 0012 4c-2.34 0-4.29 1.009-5.824 2.709"></path>
-                </svg>
-                <h3 class="mt-2 text-sm font-medium text-gray-900">No insights found</h3>
-                <p class="mt-1 text-sm text-gray-500">Try adjusting your search or filter criteria.</p>
-            </div>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        function smartFactsDashboard() {{
-            return {{
-                searchQuery: '',
-                statusFilter: '',
-                typeFilter: '',
-                viewMode: 'grid',
-                
-                insights: {insights_json},
-                
-                get filteredInsights() {{
-                    return this.insights.filter(insight => {{
-                        const matchesSearch = !this.searchQuery || 
-                            insight.id.toLowerCase().includes(this.searchQuery.toLowerCase()) ||
-                            insight.content.toLowerCase().includes(this.searchQuery.toLowerCase());
-                        
-                        const matchesStatus = !this.statusFilter || insight.status === this.statusFilter;
-                        
-                        const matchesType = !this.typeFilter || 
-                            (this.typeFilter === 'static' && !insight.isDynamic) ||
-                            (this.typeFilter === 'dynamic' && insight.isDynamic);
-                        
-                        return matchesSearch && matchesStatus && matchesType;
-                    }});
-                }},
-                
-                get stats() {{
-                    return {{
-                        total: this.insights.length,
-                        live: this.insights.filter(i => i.status === 'live').length,
-                        review: this.insights.filter(i => i.status === 'review').length,
-                        dynamic: this.insights.filter(i => i.isDynamic).length,
-                        withCta: this.insights.filter(i => i.hasCta).length,
-                        retired: this.insights.filter(i => i.status === 'retired').length
-                    }};
-                }},
-                
-                exportToCSV() {{
-                    const csvData = this.filteredInsights.map(insight => ({{
-                        'ID': insight.id,
-                        'Status': insight.status,
-                        'Priority': insight.priority,
-                        'Type': insight.isDynamic ? 'Dynamic' : 'Static',
-                        'Content': insight.content.replace(/\\n/g, ' ').replace(/\\r/g, ''),
-                        'Dynamic Variables': insight.templateKeys ? insight.templateKeys.join('; ') : '',
-                        'CTA Text': insight.cta ? insight.cta.text : '',
-                        'CTA URL': insight.cta ? insight.cta.url : '',
-                        'Required Context': insight.requiredContext ? insight.requiredContext.join('; ') : '',
-                        'Requires Primary User': insight.requiresPrimaryUser ? 'Yes' : 'No',
-                        'Requires Profile Complete': insight.requiresProfileComplete ? 'Yes' : 'No',
-                        'Has CTA': insight.hasCta ? 'Yes' : 'No'
-                    }}));
-                    
-                    // Convert to CSV
-                    const headers = Object.keys(csvData[0]);
-                    const csvContent = [
-                        headers.join(','),
-                        ...csvData.map(row => 
-                            headers.map(header => {{
-                                const value = row[header];
-                                // Escape quotes and wrap in quotes if contains comma, quote, or newline
-                                if (typeof value === 'string' && (value.includes(',') || value.includes('"') || value.includes('\\n'))) {{
-                                    return `"${{value.replace(/"/g, '""')}}"`;
-                                }}
-                                return value;
-                            }}).join(',')
-                        )
-                    ].join('\\n');
-                    
-                    // Create and download file
-                    const blob = new Blob([csvContent], {{ type: 'text/csv;charset=utf-8;' }});
-                    const link = document.createElement('a');
-                    const url = URL.createObjectURL(blob);
-                    link.setAttribute('href', url);
-                    link.setAttribute('download', `smart_facts_export_${{new Date().toISOString().split('T')[0]}}.csv`);
-                    link.style.visibility = 'hidden';
-                    document.body.appendChild(link);
-                    link.click();
-                    document.body.removeChild(link);
-                }}
-            }}
-        }}
-    </script>
-</body>
-</html>"""
-    
-    # Format the insights data as JSON
-    insights_json = json.dumps(insights, indent=2)
+def insights_version(insights_json):
+    """Content hash of an insights payload"""
+    return hashlib.blake2b(insights_json, digest_size=8).hexdigest()
+
+def generate_dashboard_html(version):
+    """Generate the dashboard HTML that loads the given version of the insights payload"""
+    return b''.join(render_dashboard_chunks(version)).decode('utf-8')
+
+def render_dashboard_chunks(version):
+    """The dashboard HTML as UTF-8 byte chunks, to be written out without joining"""
     
     # Get current timestamp
-    last_updated = datetime.now().strftime("%B %d, %Y at %I:%M %p")
+    last_updated = _format_minute(int(time.time() // 60))
     
-    # Replace placeholders in the template
-    html_content = html_template.format(
-        insights_json=insights_json,
-        last_updated=last_updated
-    )
+    # The payload URL carries its version so browsers only refetch it when it changes
+    return (_HTML_PREFIX, last_updated.encode('utf-8'), _HTML_MIDDLE, version.encode('ascii'), _HTML_SUFFIX)
+
+@functools.lru_cache(maxsize=1)
+def _format_minute(minute):
+    """Format the timestamp for a minute since the epoch; warm invocations within a minute reuse it"""
+    return datetime.fromtimestamp(minute * 60, timezone.utc).strftime(_NOW_FMT)
+
+def write_csv(insights, path):
+    """Write the CSV export of all insights"""
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=[
+        'ID', 'Status', 'Priority', 'Type', 'Content', 'Dynamic Variables', 'CTA Text', 'CTA URL',
+        'Required Context', 'Requires Primary User', 'Requires Profile Complete', 'Has CTA'
+    ])
+    writer.writeheader()
     
-    return html_content
+    for insight in insights:
+        cta = insight.get('cta')
+        writer.writerow({
+            'ID': insight['id'],
+            'Status': insight['status'],
+            'Priority': insight['priority'],
+            'Type': 'Dynamic' if insight.get('isDynamic') else 'Static',
+            'Content': insight['content'].replace('\n', ' ').replace('\r', ''),
+            'Dynamic Variables': '; '.join(insight.get('templateKeys') or []),
+            'CTA Text': cta['text'] if cta else '',
+            'CTA URL': cta['url'] if cta else '',
+            'Required Context': '; '.join(insight.get('requiredContext') or []),
+            'Requires Primary User': 'Yes' if insight.get('requiresPrimaryUser') else 'No',
+            'Requires Profile Complete': 'Yes' if insight.get('requiresProfileComplete') else 'No',
+            'Has CTA': 'Yes' if insight.get('hasCta') else 'No'
+        })
+    
+    _write_if_changed(path, output.getvalue().encode('utf-8'))
 
-def main():
-    """Main function to build and deploy the dashboard"""
+def _dumps(obj, indent=False):
+    """Serialize to UTF-8 JSON bytes (compact unless indent), with orjson when it's installed
+    
+    orjson produces bytes directly, so the payload goes to disk without a
+    decode/encode round trip through str, and it indents in C as well.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def _loads(data):
+    """Parse JSON text or bytes, with orjson when it's installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _compact(insight):
+    """Drop empty/default fields from an insight; the page treats missing keys as falsy"""
+    return {
+        key: value for key, value in insight.items()
+        if value is not None and value is not False and value != []
+    }
+
+def write_dashboard_files(insights, insights_json, html_chunks):
+    """Write the dashboard's output files, leaving data files that are already current alone"""
+    # Compared against the files on disk, so a checkout or pull that swaps them is caught
+    if not _write_if_changed(INSIGHTS_JSON_FILE, insights_json):
+        print("Insights unchanged since the last build, only refreshing index.html")
+    
+    # The Export CSV button links straight to this file
+    write_csv(insights, CSV_EXPORT_FILE)
+    
+    # The timestamp changes every build, so index.html is always rewritten, in one
+    # writev to a temp file that then replaces the live page
+    _write_atomic('index.html', html_chunks)
+
+def _write_if_changed(path, data):
+    """Write bytes to a file unless it already holds exactly them; returns whether it wrote"""
+    try:
+        if Path(path).read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    _write_atomic(path, data)
+    return True
+
+def _write_atomic(path, data):
+    """Write a file via a temp file, so a failed build never leaves it half-written
+    
+    data is a str/bytes or a sequence of them, written back to back with a
+    single writev(2) where the platform has it, without joining.
+    """
+    tmp_path = f'{path}.tmp'
+    chunks = (data,) if isinstance(data, (str, bytes)) else data
+    chunks = [chunk.encode('utf-8') if isinstance(chunk, str) else chunk for chunk in chunks]
+    if not hasattr(os, 'writev'):
+        chunks = [b''.join(chunks)]
+    
+    # Every chunk is already whole, so hand them straight to the OS without
+    # going through Python's buffered and text IO layers
+    fd = os.open(tmp_path, _WRITE_FLAGS, 0o644)
+    try:
+        buffers = [memoryview(chunk) for chunk in chunks if chunk]
+        while buffers:
+            written = os.writev(fd, buffers) if len(buffers) > 1 else os.write(fd, buffers[0])
+            # A short write can stop partway through a buffer; resume from there
+            while buffers and written >= len(buffers[0]):
+                written -= len(buffers.pop(0))
+            if buffers:
+                buffers[0] = buffers[0][written:]
+    finally:
+        os.close(fd)
+    
+    os.replace(tmp_path, path)
+
+def build_dashboard():
+    """Build the dashboard's files; returns the rendered page as byte chunks"""
     print("Building Smart Facts Dashboard...")
     
     # Extract insights data
     insights = extract_smart_facts_from_codebase()
     print(f"Extracted {len(insights)} insights")
     
-    # Generate HTML
-    html_content = generate_dashboard_html(insights)
+    # Generate the insights payload and the HTML that loads it
+    insights_json = generate_insights_json(insights)
+    version = insights_version(insights_json)
+    html_chunks = render_dashboard_chunks(version)
     
-    # Write to index.html
-    with open('index.html', 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # The chunks pin down the page exactly, so a warm process that already
+    # rendered and wrote this page can skip the writes
+    if html_chunks in _HTML_CACHE:
+        _HTML_CACHE.move_to_end(html_chunks)
+        print("Dashboard already built by this process, skipping writes")
+    else:
+        write_dashboard_files(insights, insights_json, html_chunks)
+        
+        # The response body is only encoded if main() asks for it
+        _HTML_CACHE[html_chunks] = None
+        if len(_HTML_CACHE) > _HTML_CACHE_SIZE:
+            _HTML_CACHE.popitem(last=False)
     
     print("Dashboard built successfully!")
     print(f"Generated index.html with {len(insights)} insights")
     
+    return html_chunks
+
+def main():
+    """Lambda entry point: build the dashboard and return the page as the response"""
+    html_chunks = build_dashboard()
+    
+    # Static hosting compresses on its own; only the Lambda response is gzipped here
+    body = _HTML_CACHE.get(html_chunks)
+    if body is None:
+        html_gz = gzip.compress(b''.join(html_chunks), compresslevel=9, mtime=0)
+        body = base64.b64encode(html_gz).decode('ascii')
+        if html_chunks in _HTML_CACHE:
+            _HTML_CACHE[html_chunks] = body
+    
     return {
         'statusCode': 200,
         'headers': {
             'Content-Type': 'text/html',
+            'Content-Encoding': 'gzip',
         },
-        'body': html_content
+        'body': body,
+        'isBase64Encoded': True
     }
 
 if __name__ == '__main__':
-    main()
+    # Command-line and CI builds only need the files on disk, not a response body
+    build_dashboard()
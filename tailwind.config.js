@@ -0,0 +1,9 @@
+/** @type {import('tailwindcss').Config} */
+module.exports = {
+  // Only classes that appear in the generated dashboard end up in dashboard.css
+  content: ['./index.html'],
+  theme: {
+    extend: {},
+  },
+  plugins: [],
+};